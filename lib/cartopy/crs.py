@@ -11,6 +11,8 @@ between them.
 """
 
 from abc import ABCMeta, abstractproperty
+import bisect
+import functools
 import io
 import math
 import warnings
@@ -18,6 +20,7 @@ import warnings
 import numpy as np
 import shapely.geometry as sgeom
 from shapely.prepared import prep
+from shapely.strtree import STRtree
 
 from cartopy._crs import (CRS, Geodetic, Globe, PROJ4_VERSION,
                           WGS84_SEMIMAJOR_AXIS, WGS84_SEMIMINOR_AXIS)
@@ -28,6 +31,25 @@ import cartopy.trace
 __document_these__ = ['CRS', 'Geocentric', 'Geodetic', 'Globe']
 
 
+# Conversion factors between degrees and radians, precomputed once
+# rather than on every projection construction.
+_RAD_PER_DEG = math.radians(1)
+_DEG_PER_RAD = math.degrees(1)
+
+# Proj version predicates used by the constructors below, evaluated once
+# at import rather than as tuple comparisons per instantiation.  An
+# unknown version reports as the empty tuple, which compares less than
+# everything.
+_PROJ_VERSION_UNKNOWN = PROJ4_VERSION == ()
+_PROJ_LT_4_9_2 = PROJ4_VERSION < (4, 9, 2)
+_PROJ_LT_5_0_0 = PROJ4_VERSION < (5, 0, 0)
+_PROJ_LT_5_2_0 = PROJ4_VERSION < (5, 2, 0)
+_PROJ_LT_6_0_0 = PROJ4_VERSION < (6, 0, 0)
+_PROJ_LT_7_1_0 = PROJ4_VERSION < (7, 1, 0)
+_PROJ_4_8_SERIES = (4, 8) <= PROJ4_VERSION < (4, 9)
+_PROJ_5_0_SERIES = (5, 0, 0) <= PROJ4_VERSION < (5, 1, 0)
+
+
 class RotatedGeodetic(CRS):
     """
     Define a rotated latitude/longitude coordinate system with spherical
@@ -59,15 +81,29 @@ class RotatedGeodetic(CRS):
             A :class:`cartopy.crs.Globe`.  Defaults to a "WGS84" datum.
 
         """
-        proj4_params = [('proj', 'ob_tran'), ('o_proj', 'latlon'),
+        proj4_params = (('proj', 'ob_tran'), ('o_proj', 'latlon'),
                         ('o_lon_p', central_rotated_longitude),
                         ('o_lat_p', pole_latitude),
                         ('lon_0', 180 + pole_longitude),
-                        ('to_meter', math.radians(1))]
+                        ('to_meter', _RAD_PER_DEG))
         globe = globe or Globe(datum='WGS84')
         super().__init__(proj4_params, globe=globe)
 
 
+@functools.lru_cache(maxsize=128)
+def _determine_longitude_bounds(central_longitude):
+    # In new proj, using exact limits will wrap-around, so subtract a
+    # small epsilon:
+    epsilon = 1e-10
+    minlon = -180 + central_longitude
+    maxlon = 180 + central_longitude
+    if central_longitude > 0:
+        maxlon -= epsilon
+    elif central_longitude < 0:
+        minlon += epsilon
+    return minlon, maxlon
+
+
 class Projection(CRS, metaclass=ABCMeta):
     """
     Define a projected coordinate system with flat topology and Euclidean
@@ -105,6 +141,17 @@ class Projection(CRS, metaclass=ABCMeta):
     def threshold(self, t):
         self._threshold = t
 
+    @property
+    def _geodetic(self):
+        # A shared geodetic CRS, created on first use. Repeated
+        # project_geometry calls would otherwise ask Proj to initialise an
+        # identical Geodetic instance for every geometry.
+        try:
+            geodetic = self._geodetic_cache
+        except AttributeError:
+            geodetic = self._geodetic_cache = self.as_geodetic()
+        return geodetic
+
     @property
     def cw_boundary(self):
         try:
@@ -119,7 +166,8 @@ class Projection(CRS, metaclass=ABCMeta):
         try:
             boundary = self._ccw_boundary
         except AttributeError:
-            boundary = sgeom.LinearRing(self.boundary.coords[::-1])
+            coords = np.asarray(self.boundary.coords)
+            boundary = sgeom.LinearRing(coords[::-1])
             self._ccw_boundary = boundary
         return boundary
 
@@ -131,17 +179,16 @@ class Projection(CRS, metaclass=ABCMeta):
             domain = self._domain = sgeom.Polygon(self.boundary)
         return domain
 
+    @property
+    def _domain_prepped(self):
+        try:
+            domain = self._domain_prepped_cache
+        except AttributeError:
+            domain = self._domain_prepped_cache = prep(self.domain)
+        return domain
+
     def _determine_longitude_bounds(self, central_longitude):
-        # In new proj, using exact limits will wrap-around, so subtract a
-        # small epsilon:
-        epsilon = 1e-10
-        minlon = -180 + central_longitude
-        maxlon = 180 + central_longitude
-        if central_longitude > 0:
-            maxlon -= epsilon
-        elif central_longitude < 0:
-            minlon += epsilon
-        return minlon, maxlon
+        return _determine_longitude_bounds(central_longitude)
 
     def _repr_html_(self):
         from html import escape
@@ -172,7 +219,7 @@ class Projection(CRS, metaclass=ABCMeta):
         import cartopy.mpl.geoaxes as geoaxes
         return geoaxes.GeoAxes, {'map_projection': self}
 
-    def project_geometry(self, geometry, src_crs=None):
+    def project_geometry(self, geometry, src_crs=None, fast=False):
         """
         Project the given geometry into this projection.
 
@@ -185,6 +232,18 @@ class Projection(CRS, metaclass=ABCMeta):
 
             If src_crs is None, the source CRS is assumed to be a geodetic
             version of the target CRS.
+        fast: optional
+            If True, transform each coordinate of the geometry directly,
+            without cutting the geometry at the projection boundary or
+            interpolating extra points along its edges. This is much
+            faster, but only appropriate when the geometry is known not
+            to cross the boundary (or any interruption) of this
+            projection. Defaults to False.
+
+            Note that the fast path preserves the input geometry type:
+            a LineString comes back as a LineString and a Polygon as a
+            Polygon, whereas the default path wraps them in
+            MultiLineString and MultiPolygon containers respectively.
 
         Returns
         -------
@@ -193,7 +252,7 @@ class Projection(CRS, metaclass=ABCMeta):
 
         """
         if src_crs is None:
-            src_crs = self.as_geodetic()
+            src_crs = self._geodetic
         elif not isinstance(src_crs, CRS):
             raise TypeError('Source CRS must be an instance of CRS'
                             ' or one of its subclasses, or None.')
@@ -202,8 +261,50 @@ class Projection(CRS, metaclass=ABCMeta):
         if not method_name:
             raise ValueError('Unsupported geometry '
                              'type {!r}'.format(geom_type))
+        if src_crs is self or src_crs == self:
+            # An identity transform still needs cutting at the projection
+            # boundary, so only bypass the pipeline when the geometry lies
+            # entirely within the domain.  Match the return types of the
+            # _project_* methods so callers see no difference.
+            if not geometry.is_empty and self._domain_prepped.covers(geometry):
+                if geom_type == 'LineString':
+                    return sgeom.MultiLineString([geometry])
+                elif geom_type == 'LinearRing':
+                    return [geometry], sgeom.MultiLineString([])
+                elif geom_type == 'Polygon':
+                    return sgeom.MultiPolygon([geometry])
+                return geometry
+        if fast:
+            return self._project_fast(geometry, src_crs)
         return getattr(self, method_name)(geometry, src_crs)
 
+    def _project_fast(self, geometry, src_crs):
+        """
+        Project the coordinates of the given geometry without any
+        boundary cutting or interpolation.
+
+        """
+        geom_type = geometry.geom_type
+        if geom_type == 'Point':
+            return self._project_point(geometry, src_crs)
+        elif geom_type.startswith('Multi'):
+            return type(geometry)([self._project_fast(geom, src_crs)
+                                   for geom in geometry.geoms])
+        elif geom_type == 'Polygon':
+            shell = self._fast_transform_coords(geometry.exterior, src_crs)
+            holes = [self._fast_transform_coords(ring, src_crs)
+                     for ring in geometry.interiors]
+            return sgeom.Polygon(shell, holes)
+        else:
+            # LineString or LinearRing.
+            return type(geometry)(
+                self._fast_transform_coords(geometry, src_crs))
+
+    def _fast_transform_coords(self, geometry, src_crs):
+        coords = np.asarray(geometry.coords)
+        return self.transform_points(src_crs, coords[:, 0],
+                                     coords[:, 1])[:, :2]
+
     def _project_point(self, point, src_crs):
         return sgeom.Point(*self.transform_point(point.x, point.y, src_crs))
 
@@ -228,8 +329,13 @@ class Projection(CRS, metaclass=ABCMeta):
         # point as another.
         threshold = max(np.abs(self.x_limits + self.y_limits)) * 1e-5
 
+        # Work on a plain Python list of the component lines; the final
+        # MultiLineString is only rebuilt if the set of lines changes.
+        lines = list(multi_line_string)
+        any_modified = False
+
         # 2) Simplify the segments where appropriate.
-        if len(multi_line_string) > 1:
+        if len(lines) > 1:
             # Stitch together segments which are close to continuous.
             # This is important when:
             # 1) The first source point projects into the map and the
@@ -240,92 +346,111 @@ class Projection(CRS, metaclass=ABCMeta):
             # 2) The cut ends of segments are too close to reliably
             # place into an order along the boundary.
 
-            line_strings = list(multi_line_string)
-            any_modified = False
-            i = 0
+            line_strings = lines
+            n_lines = len(line_strings)
+
+            # Compare every segment start against every segment end in one
+            # vectorized pass, using the same tolerance as
+            # np.allclose(..., atol=threshold), rather than scanning the
+            # pairs with a quadratic Python loop.
+            firsts = np.array([ls.coords[0] for ls in line_strings])
+            lasts = np.array([ls.coords[-1] for ls in line_strings])
             if debug:
-                first_coord = np.array([ls.coords[0] for ls in line_strings])
-                last_coord = np.array([ls.coords[-1] for ls in line_strings])
                 print('Distance matrix:')
                 np.set_printoptions(precision=2)
-                x = first_coord[:, np.newaxis, :]
-                y = last_coord[np.newaxis, :, :]
+                x = firsts[:, np.newaxis, :]
+                y = lasts[np.newaxis, :, :]
                 print(np.abs(x - y).max(axis=-1))
 
-            while i < len(line_strings):
-                modified = False
-                j = 0
-                while j < len(line_strings):
-                    if i != j and np.allclose(line_strings[i].coords[0],
-                                              line_strings[j].coords[-1],
-                                              atol=threshold):
+            continues = np.all(
+                np.abs(firsts[np.newaxis] - lasts[:, np.newaxis]) <=
+                threshold + 1e-5 * np.abs(lasts[:, np.newaxis]), axis=-1)
+            continues[np.arange(n_lines), np.arange(n_lines)] = False
+
+            # Chain each segment to (at most) one continuation.
+            successor = np.full(n_lines, -1, dtype=int)
+            has_predecessor = np.zeros(n_lines, dtype=bool)
+            for j in range(n_lines):
+                for i in np.nonzero(continues[j])[0]:
+                    if not has_predecessor[i]:
                         if debug:
                             print('Joining together {} and {}.'.format(i, j))
-                        last_coords = list(line_strings[j].coords)
-                        first_coords = list(line_strings[i].coords)[1:]
-                        combo = sgeom.LineString(last_coords + first_coords)
-                        if j < i:
-                            i, j = j, i
-                        del line_strings[j], line_strings[i]
-                        line_strings.append(combo)
-                        modified = True
+                        successor[j] = i
+                        has_predecessor[i] = True
                         any_modified = True
                         break
-                    else:
-                        j += 1
-                if not modified:
-                    i += 1
+
             if any_modified:
-                multi_line_string = sgeom.MultiLineString(line_strings)
+                # Walk the chains, concatenating the coordinates once per
+                # merged line. Segments without a predecessor start a
+                # chain; anything left afterwards is a closed cycle.
+                merged = []
+                done = np.zeros(n_lines, dtype=bool)
+                order = [i for i in range(n_lines)
+                         if not has_predecessor[i]] + list(range(n_lines))
+                for start in order:
+                    if done[start]:
+                        continue
+                    done[start] = True
+                    i = successor[start]
+                    if i == -1 and not has_predecessor[start]:
+                        # Nothing was attached to this segment.
+                        merged.append(line_strings[start])
+                        continue
+                    coords = list(line_strings[start].coords)
+                    while i != -1 and not done[i]:
+                        coords.extend(line_strings[i].coords[1:])
+                        done[i] = True
+                        i = successor[i]
+                    merged.append(sgeom.LineString(coords))
+                lines = merged
 
         # 3) Check for rings that have been created by the projection stage.
         rings = []
         line_strings = []
-        for line in multi_line_string:
-            if len(line.coords) > 3 and np.allclose(line.coords[0],
-                                                    line.coords[-1],
-                                                    atol=threshold):
-                result_geometry = sgeom.LinearRing(line.coords[:-1])
+        for line in lines:
+            coords = line.coords
+            c0, cl = coords[0], coords[-1]
+            # Plain float comparisons matching np.allclose(c0, cl,
+            # atol=threshold), without the per-line ufunc dispatch.
+            if (len(coords) > 3 and
+                    abs(c0[0] - cl[0]) <= threshold + 1e-5 * abs(cl[0]) and
+                    abs(c0[1] - cl[1]) <= threshold + 1e-5 * abs(cl[1])):
+                result_geometry = sgeom.LinearRing(coords[:-1])
                 rings.append(result_geometry)
             else:
                 line_strings.append(line)
-        # If we found any rings, then we should re-create the multi-line str.
-        if rings:
+        # Only re-create the multi-line string when stitching or ring
+        # extraction actually changed the set of lines.
+        if any_modified or rings:
             multi_line_string = sgeom.MultiLineString(line_strings)
 
         return rings, multi_line_string
 
     def _project_multipoint(self, geometry, src_crs):
-        geoms = []
-        for geom in geometry.geoms:
-            geoms.append(self._project_point(geom, src_crs))
-        if geoms:
-            return sgeom.MultiPoint(geoms)
-        else:
+        if not geometry.geoms:
             return sgeom.MultiPoint()
+        # Transform all the points in one go rather than round-tripping
+        # through Proj once per point.
+        coords = np.array([geom.coords[0] for geom in geometry.geoms])
+        points = self.transform_points(src_crs, coords[:, 0], coords[:, 1])
+        return sgeom.MultiPoint(points[:, :2])
 
     def _project_multiline(self, geometry, src_crs):
-        geoms = []
-        for geom in geometry.geoms:
-            r = self._project_line_string(geom, src_crs)
-            if r:
-                geoms.extend(r.geoms)
+        parts = [self._project_line_string(geom, src_crs)
+                 for geom in geometry.geoms]
+        geoms = [geom for part in parts if part for geom in part.geoms]
         if geoms:
             return sgeom.MultiLineString(geoms)
         else:
             return []
 
     def _project_multipolygon(self, geometry, src_crs):
-        geoms = []
-        for geom in geometry.geoms:
-            r = self._project_polygon(geom, src_crs)
-            if r:
-                geoms.extend(r.geoms)
-        if geoms:
-            result = sgeom.MultiPolygon(geoms)
-        else:
-            result = sgeom.MultiPolygon()
-        return result
+        parts = [self._project_polygon(geom, src_crs)
+                 for geom in geometry.geoms]
+        geoms = [geom for part in parts if part for geom in part.geoms]
+        # MultiPolygon of an empty list is already the empty MultiPolygon.
+        return sgeom.MultiPolygon(geoms)
 
     def _project_polygon(self, polygon, src_crs):
         """
@@ -389,21 +514,32 @@ class Projection(CRS, metaclass=ABCMeta):
             line_strings.extend(multi_line_string)
 
         # Record the positions of all the segment ends
+        line_end_dists = {}
         for i, line_string in enumerate(line_strings):
             first_dist = boundary_distance(line_string.coords[0])
             thing = _BoundaryPoint(first_dist, False,
                                    (i, 'first', line_string.coords[0]))
             edge_things.append(thing)
             last_dist = boundary_distance(line_string.coords[-1])
+            line_end_dists[i] = last_dist
             thing = _BoundaryPoint(last_dist, False,
                                    (i, 'last', line_string.coords[-1]))
             edge_things.append(thing)
 
-        # Record the positions of all the boundary vertices
-        for xy in boundary.coords[:-1]:
-            point = sgeom.Point(*xy)
-            dist = boundary.project(point)
-            thing = _BoundaryPoint(dist, True, point)
+        # Record the positions of all the boundary vertices. The distance
+        # of a vertex along the boundary is just the accumulated length of
+        # the preceding segments, so there is no need to route each vertex
+        # through boundary.project.
+        coords = np.asarray(boundary.coords)
+        seg_dists = np.hypot(np.diff(coords[:, 0]), np.diff(coords[:, 1]))
+        vertex_dists = np.empty(len(coords) - 1)
+        vertex_dists[0] = 0
+        np.cumsum(seg_dists[:-1], out=vertex_dists[1:])
+        # Boundary points are stored as plain coordinate tuples; there is
+        # no need to wrap each one in a shapely Point just to unwrap it
+        # again when appending to a ring.
+        for xy, dist in zip(map(tuple, coords[:-1]), vertex_dists):
+            thing = _BoundaryPoint(dist, True, xy)
             edge_things.append(thing)
 
         if debug_plot_edges:
@@ -422,7 +558,9 @@ class Projection(CRS, metaclass=ABCMeta):
         remaining_ls = dict(enumerate(line_strings))
 
         prev_thing = None
-        for edge_thing in edge_things[:]:
+        ind = 0
+        while ind < len(edge_things):
+            edge_thing = edge_things[ind]
             if (prev_thing is not None and
                     not edge_thing.kind and
                     not prev_thing.kind and
@@ -430,15 +568,16 @@ class Projection(CRS, metaclass=ABCMeta):
                 j = edge_thing.data[0]
                 # Insert a edge boundary point in between this geometry.
                 mid_dist = (edge_thing.distance + prev_thing.distance) * 0.5
-                mid_point = boundary.interpolate(mid_dist)
+                mid_point = boundary.interpolate(mid_dist).coords[0]
                 new_thing = _BoundaryPoint(mid_dist, True, mid_point)
                 if debug:
                     print('Artificially insert boundary: {}'.format(new_thing))
-                ind = edge_things.index(edge_thing)
                 edge_things.insert(ind, new_thing)
+                ind += 1
                 prev_thing = None
             else:
                 prev_thing = edge_thing
+            ind += 1
 
         if debug:
             print()
@@ -447,8 +586,8 @@ class Projection(CRS, metaclass=ABCMeta):
                 print('   ', thing)
         if debug_plot_edges:
             for thing in edge_things:
-                if isinstance(thing.data, sgeom.Point):
-                    ax.plot(*thing.data.xy, marker='o')
+                if thing.kind:
+                    ax.plot(*thing.data, marker='o')
                 else:
                     ax.plot(*thing.data[2], marker='o')
                     ls = line_strings[thing.data[0]]
@@ -462,6 +601,10 @@ class Projection(CRS, metaclass=ABCMeta):
             return t.kind or t.data[1] == 'first'
 
         edge_things = list(filter(filter_last, edge_things))
+        # A parallel, sorted list of distances so the walk below can find
+        # and remove the next edge thing by bisection rather than a linear
+        # scan per step.
+        edge_distances = [thing.distance for thing in edge_things]
 
         processed_ls = []
         while remaining_ls:
@@ -475,36 +618,45 @@ class Projection(CRS, metaclass=ABCMeta):
                 print()
                 print('Processing: {}, {}'.format(i, current_ls))
 
+            # Accumulate the coordinates in a plain list; the LineString
+            # is only built once the ring is closed, rather than being
+            # rebuilt from scratch on every step of the walk.
+            current_coords = list(current_ls.coords)
+
             added_linestring = set()
+            # How far around the boundary the linestring's last point is.
+            # We use this to find the next point on the boundary, and the
+            # value is updated as things are appended, so it never needs
+            # re-measuring with boundary.project.
+            d_last = line_end_dists[i]
             while True:
-                # Find out how far around this linestring's last
-                # point is on the boundary. We will use this to find
-                # the next point on the boundary.
-                d_last = boundary_distance(current_ls.coords[-1])
                 if debug:
                     print('   d_last: {!r}'.format(d_last))
-                next_thing = _find_first_ge(edge_things, d_last)
+                ind = bisect.bisect_left(edge_distances, d_last)
+                if ind == len(edge_things):
+                    # We've gone all the way around, so pick the first
+                    # point again.
+                    ind = 0
                 # Remove this boundary point from the edge.
-                edge_things.remove(next_thing)
+                next_thing = edge_things.pop(ind)
+                edge_distances.pop(ind)
                 if debug:
                     print('   next_thing:', next_thing)
                 if next_thing.kind:
                     # We've just got a boundary point, add it, and keep going.
                     if debug:
                         print('   adding boundary point')
-                    boundary_point = next_thing.data
-                    combined_coords = (list(current_ls.coords) +
-                                       [(boundary_point.x, boundary_point.y)])
-                    current_ls = sgeom.LineString(combined_coords)
+                    current_coords.append(next_thing.data)
+                    d_last = next_thing.distance
 
                 elif next_thing.data[0] == i:
                     # We've gone all the way around and are now back at the
                     # first boundary thing.
                     if debug:
                         print('   close loop')
-                    processed_ls.append(current_ls)
+                    processed_ls.append(sgeom.LineString(current_coords))
                     if debug_plot_edges:
-                        coords = np.array(current_ls.coords)
+                        coords = np.array(current_coords)
                         ax.plot(coords[:, 0], coords[:, 1], color='black',
                                 linestyle='--')
                     break
@@ -515,11 +667,10 @@ class Projection(CRS, metaclass=ABCMeta):
                     line_to_append = line_strings[j]
                     if j in remaining_ls:
                         remaining_ls.pop(j)
-                    coords_to_append = list(line_to_append.coords)
 
                     # Build up the linestring.
-                    current_ls = sgeom.LineString(list(current_ls.coords) +
-                                                  coords_to_append)
+                    current_coords.extend(line_to_append.coords)
+                    d_last = line_end_dists[j]
 
                     # Catch getting stuck in an infinite loop by checking that
                     # linestring only added once.
@@ -565,54 +716,58 @@ class Projection(CRS, metaclass=ABCMeta):
 
         polygon_bits = []
 
+        # Spatially index the interior rings so that each exterior ring
+        # only tests the interiors whose envelopes overlap its own,
+        # rather than every remaining combination.
+        if interior_rings and exterior_rings:
+            interior_tree = STRtree(interior_rings)
+            interior_index = {id(ring): i
+                              for i, ring in enumerate(interior_rings)}
+            consumed = [False] * len(interior_rings)
+
         # Turn all the exterior rings into polygon definitions,
         # "slurping up" any interior rings they contain.
         for exterior_ring in exterior_rings:
             polygon = sgeom.Polygon(exterior_ring)
             prep_polygon = prep(polygon)
             holes = []
-            for interior_ring in interior_rings[:]:
-                if prep_polygon.contains(interior_ring):
-                    holes.append(interior_ring)
-                    interior_rings.remove(interior_ring)
-                elif polygon.crosses(interior_ring):
-                    # Likely that we have an invalid geometry such as
-                    # that from #509 or #537.
-                    holes.append(interior_ring)
-                    interior_rings.remove(interior_ring)
+            if interior_rings:
+                candidates = sorted(interior_index[id(candidate)]
+                                    for candidate in
+                                    interior_tree.query(polygon))
+                for i in candidates:
+                    if consumed[i]:
+                        continue
+                    interior_ring = interior_rings[i]
+                    # A crossing ring is likely an invalid geometry such
+                    # as that from #509 or #537; slurp it up as a hole
+                    # too.
+                    if (prep_polygon.contains(interior_ring) or
+                            polygon.crosses(interior_ring)):
+                        holes.append(interior_ring)
+                        consumed[i] = True
             polygon_bits.append((exterior_ring.coords,
                                  [ring.coords for ring in holes]))
 
+        if interior_rings and exterior_rings:
+            interior_rings = [ring
+                              for i, ring in enumerate(interior_rings)
+                              if not consumed[i]]
+
         # Any left over "interior" rings need "inverting" with respect
         # to the boundary.
         if interior_rings:
             boundary_poly = self.domain
-            x3, y3, x4, y4 = boundary_poly.bounds
-            bx = (x4 - x3) * 0.1
-            by = (y4 - y3) * 0.1
-            x3 -= bx
-            y3 -= by
-            x4 += bx
-            y4 += by
             for ring in interior_rings:
                 # Use shapely buffer in an attempt to fix invalid geometries
                 polygon = sgeom.Polygon(ring).buffer(0)
                 if not polygon.is_empty and polygon.is_valid:
-                    x1, y1, x2, y2 = polygon.bounds
-                    bx = (x2 - x1) * 0.1
-                    by = (y2 - y1) * 0.1
-                    x1 -= bx
-                    y1 -= by
-                    x2 += bx
-                    y2 += by
-                    box = sgeom.box(min(x1, x3), min(y1, y3),
-                                    max(x2, x4), max(y2, y4))
-
-                    # Invert the polygon
-                    polygon = box.difference(polygon)
-
-                    # Intersect the inverted polygon with the boundary
-                    polygon = boundary_poly.intersection(polygon)
+                    # Invert the polygon within the domain. A covering box
+                    # intersected back with the boundary is equivalent to
+                    # differencing against the domain directly, and this
+                    # way costs a single GEOS boolean operation instead
+                    # of two plus the box construction.
+                    polygon = boundary_poly.difference(polygon)
 
                     if not polygon.is_empty:
                         polygon_bits.append(polygon)
@@ -638,14 +793,15 @@ class Projection(CRS, metaclass=ABCMeta):
         return_value = None
 
         if self == src_crs:
-            x = vertices[:, 0]
-            y = vertices[:, 1]
             # Extend the limits a tiny amount to allow for precision mistakes
             epsilon = 1.e-10
-            x_limits = (self.x_limits[0] - epsilon, self.x_limits[1] + epsilon)
-            y_limits = (self.y_limits[0] - epsilon, self.y_limits[1] + epsilon)
-            if (x.min() >= x_limits[0] and x.max() <= x_limits[1] and
-                    y.min() >= y_limits[0] and y.max() <= y_limits[1]):
+            lower = np.array([self.x_limits[0] - epsilon,
+                              self.y_limits[0] - epsilon])
+            upper = np.array([self.x_limits[1] + epsilon,
+                              self.y_limits[1] + epsilon])
+            # A single fused comparison pass rather than four separate
+            # min/max reductions over the columns.
+            if np.all((vertices >= lower) & (vertices <= upper)):
                 return_value = vertices
 
         return return_value
@@ -660,12 +816,29 @@ class _RectangularProjection(Projection, metaclass=ABCMeta):
     def __init__(self, proj4_params, half_width, half_height, globe=None):
         self._half_width = half_width
         self._half_height = half_height
+        w, h = half_width, half_height
+        self._boundary_xy = np.array([(-w, -h), (-w, h), (w, h),
+                                      (w, -h), (-w, -h)])
         super().__init__(proj4_params, globe=globe)
 
     @property
     def boundary(self):
-        w, h = self._half_width, self._half_height
-        return sgeom.LinearRing([(-w, -h), (-w, h), (w, h), (w, -h), (-w, -h)])
+        try:
+            return self._boundary
+        except AttributeError:
+            self._boundary = sgeom.LinearRing(self._boundary_xy)
+        return self._boundary
+
+    @property
+    def ccw_boundary(self):
+        try:
+            boundary = self._ccw_boundary
+        except AttributeError:
+            # Reverse the cached corner array directly; no need to go
+            # back through the shapely coords.
+            boundary = sgeom.LinearRing(self._boundary_xy[::-1])
+            self._ccw_boundary = boundary
+        return boundary
 
     @property
     def x_limits(self):
@@ -684,26 +857,155 @@ class _CylindricalProjection(_RectangularProjection, metaclass=ABCMeta):
     """
 
 
+@functools.lru_cache(maxsize=8)
+def _boundary_trig(n):
+    """
+    Return cached (cos, sin) tables for an n-point clockwise sweep of
+    the full circle, as used by the elliptical boundary builders.
+
+    """
+    t = np.linspace(0, -2 * np.pi, n)  # Clockwise boundary.
+    cos_t = np.cos(t)
+    sin_t = np.sin(t)
+    # Guard the cached tables against accidental in-place edits.
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
+
+
+@functools.lru_cache(maxsize=32)
+def _lin_ramp(start, stop, num):
+    """
+    Return a cached, read-only ``np.linspace(start, stop, num)`` for the
+    boundary builders, which sweep the same few ramps repeatedly.
+
+    """
+    ramp = np.linspace(start, stop, num)
+    ramp.setflags(write=False)
+    return ramp
+
+
+@functools.lru_cache(maxsize=64)
+def _conic_boundary_lonlat(minlon, maxlon, n=103):
+    """
+    Return cached, read-only lon/lat arrays sweeping the top and bottom
+    edges of a conic projection's full extent.  The sweep only depends
+    on the longitude bounds, so all conic projections with the same
+    central longitude share one pair of arrays.
+
+    """
+    lons = np.empty(2 * n + 1)
+    lats = np.empty(2 * n + 1)
+    tmp = _lin_ramp(minlon, maxlon, n)
+    lons[:n] = tmp
+    lats[:n] = 90
+    lons[n:-1] = tmp[::-1]
+    lats[n:-1] = -90
+    lons[-1] = lons[0]
+    lats[-1] = lats[0]
+    lons.setflags(write=False)
+    lats.setflags(write=False)
+    return lons, lats
+
+
+def _semimajor_axis(globe):
+    """
+    Return the globe's semimajor axis as a float, defaulting to the
+    WGS84 value when the globe does not define one.
+
+    The result is cached on the globe, which several projections consult
+    repeatedly.  A globe's axes are fixed once it has been handed to a
+    CRS (the proj4 definition is built from them at that point), so the
+    cache cannot go stale.
+
+    """
+    try:
+        return globe._semimajor_eff
+    except AttributeError:
+        globe._semimajor_eff = float(
+            globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
+        return globe._semimajor_eff
+
+
+def _semiminor_axis(globe, default=WGS84_SEMIMINOR_AXIS):
+    """
+    Return the globe's semiminor axis as a float, falling back to the
+    given default (the WGS84 value unless stated otherwise).  Cached on
+    the globe per default, as for :func:`_semimajor_axis`.
+
+    """
+    try:
+        return globe._semiminor_eff[default]
+    except AttributeError:
+        globe._semiminor_eff = {}
+    except KeyError:
+        pass
+    value = float(globe.semiminor_axis or default)
+    globe._semiminor_eff[default] = value
+    return value
+
+
+def _rect_ring(x0, y0, x1, y1):
+    """
+    Define an axis-aligned rectangular projection boundary.
+
+    The corners are handed to shapely as one contiguous float64 array,
+    which avoids iterating a Python list of tuples in the constructor.
+
+    """
+    return sgeom.LinearRing(np.array([[x0, y0], [x0, y1], [x1, y1],
+                                      [x1, y0], [x0, y0]]))
+
+
 def _ellipse_boundary(semimajor=2, semiminor=1, easting=0, northing=0, n=201):
     """
     Define a projection boundary using an ellipse.
 
-    This type of boundary is used by several projections.
+    This type of boundary is used by several projections.  The vertices
+    are returned as a C-contiguous ``(n, 2)`` array, the layout both
+    shapely and the limit reductions consume directly.
 
     """
 
-    t = np.linspace(0, -2 * np.pi, n)  # Clockwise boundary.
-    coords = np.vstack([semimajor * np.cos(t), semiminor * np.sin(t)])
-    coords += ([easting], [northing])
+    cos_t, sin_t = _boundary_trig(n)
+    # Write the scaled tables straight into the output array rather than
+    # allocating temporaries for the stack and the broadcast addition.
+    coords = np.empty((n, 2))
+    np.multiply(cos_t, semimajor, out=coords[:, 0])
+    coords[:, 0] += easting
+    np.multiply(sin_t, semiminor, out=coords[:, 1])
+    coords[:, 1] += northing
     return coords
 
 
+@functools.lru_cache(maxsize=128)
+def _bbox_and_offset(self_lon_0, other_lon_0, self_x_limits, other_x_lower):
+    lon_0_offset = other_lon_0 - self_lon_0
+    x_range = self_x_limits[1] - self_x_limits[0]
+
+    lon_lower_bound_0 = self_x_limits[0]
+    lon_lower_bound_1 = other_x_lower + lon_0_offset
+
+    if lon_lower_bound_1 < self_x_limits[0]:
+        lon_lower_bound_1 += x_range
+
+    lon_lower_bound_0, lon_lower_bound_1 = sorted(
+        [lon_lower_bound_0, lon_lower_bound_1])
+
+    # Tuples rather than lists so the cached value cannot be mutated by
+    # callers.
+    bbox = ((lon_lower_bound_0, lon_lower_bound_1),
+            (lon_lower_bound_1, lon_lower_bound_0 + x_range))
+
+    return bbox, lon_0_offset
+
+
 class PlateCarree(_CylindricalProjection):
     def __init__(self, central_longitude=0.0, globe=None):
-        proj4_params = [('proj', 'eqc'), ('lon_0', central_longitude)]
+        proj4_params = (('proj', 'eqc'), ('lon_0', central_longitude))
         if globe is None:
-            globe = Globe(semimajor_axis=math.degrees(1))
-        a_rad = math.radians(globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
+            globe = Globe(semimajor_axis=_DEG_PER_RAD)
+        a_rad = _RAD_PER_DEG * (globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
         x_max = a_rad * 180
         y_max = a_rad * 90
         # Set the threshold around 0.5 if the x max is 180.
@@ -733,26 +1035,11 @@ class PlateCarree(_CylindricalProjection):
             central longitudes. No checking of this is done.
 
         """
-        self_lon_0 = self.proj4_params['lon_0']
-        other_lon_0 = other_plate_carree.proj4_params['lon_0']
-
-        lon_0_offset = other_lon_0 - self_lon_0
-
-        lon_lower_bound_0 = self.x_limits[0]
-        lon_lower_bound_1 = (other_plate_carree.x_limits[0] + lon_0_offset)
-
-        if lon_lower_bound_1 < self.x_limits[0]:
-            lon_lower_bound_1 += np.diff(self.x_limits)[0]
-
-        lon_lower_bound_0, lon_lower_bound_1 = sorted(
-            [lon_lower_bound_0, lon_lower_bound_1])
-
-        bbox = [[lon_lower_bound_0, lon_lower_bound_1],
-                [lon_lower_bound_1, lon_lower_bound_0]]
-
-        bbox[1][1] += np.diff(self.x_limits)[0]
-
-        return bbox, lon_0_offset
+        bbox, lon_0_offset = _bbox_and_offset(
+            self.proj4_params['lon_0'],
+            other_plate_carree.proj4_params['lon_0'],
+            self.x_limits, other_plate_carree.x_limits[0])
+        return [list(pair) for pair in bbox], lon_0_offset
 
     def quick_vertices_transform(self, vertices, src_crs):
         return_value = super().quick_vertices_transform(vertices, src_crs)
@@ -771,7 +1058,7 @@ class PlateCarree(_CylindricalProjection):
                          self.y_limits[1] >= ys.max())
 
             if potential:
-                mod = np.diff(src_crs.x_limits)[0]
+                mod = src_crs.x_limits[1] - src_crs.x_limits[0]
                 bboxes, proj_offset = self._bbox_and_offset(src_crs)
                 x_lim = xs.min(), xs.max()
                 for poly in bboxes:
@@ -790,6 +1077,22 @@ class PlateCarree(_CylindricalProjection):
         return return_value
 
 
+# A shared default PlateCarree for internal transforms.  Constructing a
+# PlateCarree sets up a Proj context, so the constructors that need one
+# as a source CRS reuse this instance rather than building their own.
+_PLATE_CARREE = PlateCarree()
+
+
+def _warn_approx_default(name):
+    # Shared by the constructors which still default *approx* to True.
+    # stacklevel=3 attributes the warning to the caller of __init__, as
+    # the inlined stacklevel=2 warnings did.
+    warnings.warn('The default value for the *approx* keyword '
+                  'argument to {} will change from True to '
+                  'False after 0.18.'.format(name),
+                  stacklevel=3)
+
+
 class TransverseMercator(Projection):
     """
     A Transverse Mercator projection.
@@ -824,16 +1127,13 @@ class TransverseMercator(Projection):
 
         """
         if approx is None:
-            warnings.warn('The default value for the *approx* keyword '
-                          'argument to TransverseMercator will change '
-                          'from True to False after 0.18.',
-                          stacklevel=2)
+            _warn_approx_default('TransverseMercator')
             approx = True
         proj4_params = [('proj', 'tmerc'), ('lon_0', central_longitude),
                         ('lat_0', central_latitude), ('k', scale_factor),
                         ('x_0', false_easting), ('y_0', false_northing),
                         ('units', 'm')]
-        if PROJ4_VERSION < (6, 0, 0):
+        if _PROJ_LT_6_0_0:
             if not approx:
                 proj4_params[0] = ('proj', 'etmerc')
         else:
@@ -842,60 +1142,58 @@ class TransverseMercator(Projection):
         super().__init__(proj4_params, globe=globe)
 
         self.threshold = 1e4
+        self._x_limits = (-2e7, 2e7)
+        self._y_limits = (-1e7, 1e7)
 
     @property
     def boundary(self):
-        x0, x1 = self.x_limits
-        y0, y1 = self.y_limits
-        return sgeom.LinearRing([(x0, y0), (x0, y1),
-                                 (x1, y1), (x1, y0),
-                                 (x0, y0)])
+        # The limits are set by __init__ (and overridden by subclasses),
+        # so the ring is built lazily on first access and cached.
+        try:
+            return self._boundary
+        except AttributeError:
+            x0, x1 = self.x_limits
+            y0, y1 = self.y_limits
+            self._boundary = _rect_ring(x0, y0, x1, y1)
+        return self._boundary
 
     @property
     def x_limits(self):
-        return (-2e7, 2e7)
+        return self._x_limits
 
     @property
     def y_limits(self):
-        return (-1e7, 1e7)
+        return self._y_limits
 
 
 class OSGB(TransverseMercator):
     def __init__(self, approx=None):
         if approx is None:
-            warnings.warn('The default value for the *approx* keyword '
-                          'argument to OSGB will change from True to '
-                          'False after 0.18.',
-                          stacklevel=2)
+            _warn_approx_default('OSGB')
             approx = True
         super().__init__(central_longitude=-2, central_latitude=49,
                          scale_factor=0.9996012717,
                          false_easting=400000, false_northing=-100000,
                          globe=Globe(datum='OSGB36', ellipse='airy'),
                          approx=approx)
+        self._x_limits = (0, 7e5)
+        self._y_limits = (0, 13e5)
 
     @property
     def boundary(self):
-        w = self.x_limits[1] - self.x_limits[0]
-        h = self.y_limits[1] - self.y_limits[0]
-        return sgeom.LinearRing([(0, 0), (0, h), (w, h), (w, 0), (0, 0)])
-
-    @property
-    def x_limits(self):
-        return (0, 7e5)
-
-    @property
-    def y_limits(self):
-        return (0, 13e5)
+        try:
+            return self._boundary
+        except AttributeError:
+            w = self.x_limits[1] - self.x_limits[0]
+            h = self.y_limits[1] - self.y_limits[0]
+            self._boundary = _rect_ring(0, 0, w, h)
+        return self._boundary
 
 
 class OSNI(TransverseMercator):
     def __init__(self, approx=None):
         if approx is None:
-            warnings.warn('The default value for the *approx* keyword '
-                          'argument to OSNI will change from True to '
-                          'False after 0.18.',
-                          stacklevel=2)
+            _warn_approx_default('OSNI')
             approx = True
         globe = Globe(semimajor_axis=6377340.189,
                       semiminor_axis=6356034.447938534)
@@ -903,20 +1201,18 @@ class OSNI(TransverseMercator):
                          scale_factor=1.000035,
                          false_easting=200000, false_northing=250000,
                          globe=globe, approx=approx)
+        self._x_limits = (18814.9667, 386062.3293)
+        self._y_limits = (11764.8481, 464720.9559)
 
     @property
     def boundary(self):
-        w = self.x_limits[1] - self.x_limits[0]
-        h = self.y_limits[1] - self.y_limits[0]
-        return sgeom.LinearRing([(0, 0), (0, h), (w, h), (w, 0), (0, 0)])
-
-    @property
-    def x_limits(self):
-        return (18814.9667, 386062.3293)
-
-    @property
-    def y_limits(self):
-        return (11764.8481, 464720.9559)
+        try:
+            return self._boundary
+        except AttributeError:
+            w = self.x_limits[1] - self.x_limits[0]
+            h = self.y_limits[1] - self.y_limits[0]
+            self._boundary = _rect_ring(0, 0, w, h)
+        return self._boundary
 
 
 class UTM(Projection):
@@ -945,26 +1241,29 @@ class UTM(Projection):
             proj4_params.append(('south', None))
         super().__init__(proj4_params, globe=globe)
         self.threshold = 1e2
+        easting = 5e5
+        northing = 1e7
+        # allow 50% overflow
+        self._x_limits = (0 - easting / 2, 2 * easting + easting / 2)
+        self._y_limits = (0 - northing, 2 * northing + northing / 2)
 
     @property
     def boundary(self):
-        x0, x1 = self.x_limits
-        y0, y1 = self.y_limits
-        return sgeom.LinearRing([(x0, y0), (x0, y1),
-                                 (x1, y1), (x1, y0),
-                                 (x0, y0)])
+        try:
+            return self._boundary
+        except AttributeError:
+            x0, x1 = self.x_limits
+            y0, y1 = self.y_limits
+            self._boundary = _rect_ring(x0, y0, x1, y1)
+        return self._boundary
 
     @property
     def x_limits(self):
-        easting = 5e5
-        # allow 50% overflow
-        return (0 - easting/2, 2 * easting + easting/2)
+        return self._x_limits
 
     @property
     def y_limits(self):
-        northing = 1e7
-        # allow 50% overflow
-        return (0 - northing, 2 * northing + northing/2)
+        return self._y_limits
 
 
 class EuroPP(UTM):
@@ -977,14 +1276,14 @@ class EuroPP(UTM):
     def __init__(self):
         globe = Globe(ellipse='intl')
         super().__init__(32, globe=globe)
+        self._x_limits = (-1.4e6, 2e6)
+        self._y_limits = (4e6, 7.9e6)
 
-    @property
-    def x_limits(self):
-        return (-1.4e6, 2e6)
 
-    @property
-    def y_limits(self):
-        return (4e6, 7.9e6)
+# Cache of Mercator limits, keyed on the full proj4 definition and the
+# latitude bounds.  The proj4 string completely determines the transform,
+# so equivalent instances can share one Proj round-trip.
+_mercator_limit_cache = {}
 
 
 class Mercator(Projection):
@@ -1046,13 +1345,24 @@ class Mercator(Projection):
 
         # Calculate limits.
         minlon, maxlon = self._determine_longitude_bounds(central_longitude)
-        limits = self.transform_points(Geodetic(),
-                                       np.array([minlon, maxlon]),
-                                       np.array([min_latitude, max_latitude]))
-        self._x_limits = tuple(limits[..., 0])
-        self._y_limits = tuple(limits[..., 1])
-        self.threshold = min(np.diff(self.x_limits)[0] / 720,
-                             np.diff(self.y_limits)[0] / 360)
+        key = (self.proj4_init, minlon, maxlon, min_latitude, max_latitude)
+        try:
+            self._x_limits, self._y_limits = _mercator_limit_cache[key]
+        except KeyError:
+            limits = self.transform_points(
+                Geodetic(),
+                np.array([minlon, maxlon]),
+                np.array([min_latitude, max_latitude]))
+            # Extract the four scalars directly rather than slicing out
+            # length-2 arrays and iterating them into tuples.
+            self._x_limits = (float(limits[0, 0]), float(limits[1, 0]))
+            self._y_limits = (float(limits[0, 1]), float(limits[1, 1]))
+            _mercator_limit_cache[key] = (self._x_limits, self._y_limits)
+        self.threshold = min((self._x_limits[1] - self._x_limits[0]) / 720,
+                             (self._y_limits[1] - self._y_limits[0]) / 360)
+        # Hash inputs are fixed from here on, so compute the hash once
+        # rather than rebuilding the key tuple on every lookup.
+        self._hash = hash((self.proj4_init, self._x_limits, self._y_limits))
 
     def __eq__(self, other):
         res = super().__eq__(other)
@@ -1065,15 +1375,17 @@ class Mercator(Projection):
         return not self == other
 
     def __hash__(self):
-        return hash((self.proj4_init, self._x_limits, self._y_limits))
+        return self._hash
 
     @property
     def boundary(self):
-        x0, x1 = self.x_limits
-        y0, y1 = self.y_limits
-        return sgeom.LinearRing([(x0, y0), (x0, y1),
-                                 (x1, y1), (x1, y0),
-                                 (x0, y0)])
+        try:
+            return self._boundary
+        except AttributeError:
+            x0, x1 = self.x_limits
+            y0, y1 = self.y_limits
+            self._boundary = _rect_ring(x0, y0, x1, y1)
+        return self._boundary
 
     @property
     def x_limits(self):
@@ -1097,9 +1409,9 @@ GOOGLE_MERCATOR = Mercator.GOOGLE
 
 class LambertCylindrical(_RectangularProjection):
     def __init__(self, central_longitude=0.0):
-        proj4_params = [('proj', 'cea'), ('lon_0', central_longitude)]
+        proj4_params = (('proj', 'cea'), ('lon_0', central_longitude))
         globe = Globe(semimajor_axis=math.degrees(1))
-        super().__init__(proj4_params, 180, math.degrees(1), globe=globe)
+        super().__init__(proj4_params, 180, _DEG_PER_RAD, globe=globe)
 
 
 class LambertConformal(Projection):
@@ -1190,23 +1502,27 @@ class LambertConformal(Projection):
         lats = np.full(n + 2, float(cutoff))
         lons[0] = lons[-1] = 0
         lats[0] = lats[-1] = plat
-        if plat == 90:
-            # Ensure clockwise
-            lons[1:-1] = np.linspace(central_longitude + 180 - 0.001,
-                                     central_longitude - 180 + 0.001, n)
-        else:
-            lons[1:-1] = np.linspace(central_longitude - 180 + 0.001,
-                                     central_longitude + 180 - 0.001, n)
+        # Sweep away from the pole the cone converges to; the sign flips
+        # the direction so the boundary is always traversed clockwise.
+        sign = 1 if plat == 90 else -1
+        lons[1:-1] = _lin_ramp(central_longitude + sign * (180 - 0.001),
+                               central_longitude - sign * (180 - 0.001), n)
 
-        points = self.transform_points(PlateCarree(), lons, lats)
+        points = self.transform_points(_PLATE_CARREE, lons, lats)
 
         self._boundary = sgeom.LinearRing(points)
-        mins = np.min(points, axis=0)
-        maxs = np.max(points, axis=0)
+        # Frame the limits from a contiguous two-column view so the
+        # reductions do not also scan the unused z column.
+        pts = np.ascontiguousarray(points[:, :2])
+        mins = pts.min(axis=0)
+        maxs = pts.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
 
         self.threshold = 1e5
+        # Projections are commonly used as dict keys; the hash inputs
+        # never change after construction, so compute it once.
+        self._hash = hash((self.proj4_init, self.cutoff))
 
     def __eq__(self, other):
         res = super().__eq__(other)
@@ -1218,7 +1534,7 @@ class LambertConformal(Projection):
         return not self == other
 
     def __hash__(self):
-        return hash((self.proj4_init, self.cutoff))
+        return self._hash
 
     @property
     def boundary(self):
@@ -1258,31 +1574,34 @@ class LambertAzimuthalEqualArea(Projection):
             created.
 
         """
-        proj4_params = [('proj', 'laea'),
+        proj4_params = (('proj', 'laea'),
                         ('lon_0', central_longitude),
                         ('lat_0', central_latitude),
                         ('x_0', false_easting),
-                        ('y_0', false_northing)]
+                        ('y_0', false_northing))
 
         super().__init__(proj4_params, globe=globe)
 
-        a = float(self.globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
+        a = _semimajor_axis(self.globe)
 
         # Find the antipode, and shift it a small amount in latitude to
         # approximate the extent of the projection:
         lon = central_longitude + 180
         sign = np.sign(central_latitude) or 1
         lat = -central_latitude + sign * 0.01
-        x, max_y = self.transform_point(lon, lat, PlateCarree())
+        # Go straight through the batched transform rather than the
+        # transform_point wrapper, which builds the same arrays anyway.
+        max_y = self.transform_points(_PLATE_CARREE, np.array([lon]),
+                                      np.array([lat]))[0, 1]
 
         coords = _ellipse_boundary(a * 1.9999, max_y - false_northing,
                                    false_easting, false_northing, 61)
-        self._boundary = sgeom.polygon.LinearRing(coords.T)
-        mins = np.min(coords, axis=1)
-        maxs = np.max(coords, axis=1)
+        self._boundary = sgeom.polygon.LinearRing(coords)
+        mins = coords.min(axis=0)
+        maxs = coords.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
-        self.threshold = np.diff(self._x_limits)[0] * 1e-3
+        self.threshold = (self._x_limits[1] - self._x_limits[0]) * 1e-3
 
     @property
     def boundary(self):
@@ -1302,15 +1621,15 @@ class Miller(_RectangularProjection):
 
     def __init__(self, central_longitude=0.0, globe=None):
         if globe is None:
-            globe = Globe(semimajor_axis=math.degrees(1), ellipse=None)
+            globe = Globe(semimajor_axis=_DEG_PER_RAD, ellipse=None)
 
         # TODO: Let the globe return the semimajor axis always.
-        a = float(globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
+        a = _semimajor_axis(globe)
 
-        proj4_params = [('proj', 'mill'), ('lon_0', central_longitude)]
+        proj4_params = (('proj', 'mill'), ('lon_0', central_longitude))
         # See Snyder, 1987. Eqs (11-1) and (11-2) substituting maximums of
         # (lambda-lambda0)=180 and phi=90 to get limits.
-        super().__init__(proj4_params, a * np.pi, a * 2.303412543376391,
+        super().__init__(proj4_params, a * math.pi, a * 2.303412543376391,
                          globe=globe)
 
 
@@ -1348,11 +1667,11 @@ class RotatedPole(_CylindricalProjection):
 
         """
 
-        proj4_params = [('proj', 'ob_tran'), ('o_proj', 'latlon'),
+        proj4_params = (('proj', 'ob_tran'), ('o_proj', 'latlon'),
                         ('o_lon_p', central_rotated_longitude),
                         ('o_lat_p', pole_latitude),
                         ('lon_0', 180 + pole_longitude),
-                        ('to_meter', math.radians(1))]
+                        ('to_meter', _RAD_PER_DEG))
         super().__init__(proj4_params, 180, 90, globe=globe)
 
 
@@ -1361,23 +1680,28 @@ class Gnomonic(Projection):
 
     def __init__(self, central_latitude=0.0,
                  central_longitude=0.0, globe=None):
-        proj4_params = [('proj', 'gnom'), ('lat_0', central_latitude),
-                        ('lon_0', central_longitude)]
+        proj4_params = (('proj', 'gnom'), ('lat_0', central_latitude),
+                        ('lon_0', central_longitude))
         super().__init__(proj4_params, globe=globe)
         self._max = 5e7
+        # Buffering a point is relatively expensive, so build the
+        # boundary circle once rather than on every property access.
+        self._boundary = sgeom.Point(0, 0).buffer(self._max).exterior
+        self._x_limits = (-self._max, self._max)
+        self._y_limits = (-self._max, self._max)
         self.threshold = 1e5
 
     @property
     def boundary(self):
-        return sgeom.Point(0, 0).buffer(self._max).exterior
+        return self._boundary
 
     @property
     def x_limits(self):
-        return (-self._max, self._max)
+        return self._x_limits
 
     @property
     def y_limits(self):
-        return (-self._max, self._max)
+        return self._y_limits
 
 
 class Stereographic(Projection):
@@ -1389,8 +1713,8 @@ class Stereographic(Projection):
         # incorrect transformation with lon_0=0 (see
         # https://github.com/OSGeo/proj.4/issues/194).
         if central_latitude == 0:
-            if PROJ4_VERSION != ():
-                if PROJ4_VERSION < (5, 0, 0):
+            if not _PROJ_VERSION_UNKNOWN:
+                if _PROJ_LT_5_0_0:
                     warnings.warn(
                         'The Stereographic projection in Proj older than '
                         '5.0.0 incorrectly transforms points when '
@@ -1427,8 +1751,8 @@ class Stereographic(Projection):
         super().__init__(proj4_params, globe=globe)
 
         # TODO: Let the globe return the semimajor axis always.
-        a = float(self.globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
-        b = float(self.globe.semiminor_axis or WGS84_SEMIMINOR_AXIS)
+        a = _semimajor_axis(self.globe)
+        b = _semiminor_axis(self.globe)
 
         # Note: The magic number has been picked to maintain consistent
         # behaviour with a wgs84 globe. There is no guarantee that the scaling
@@ -1441,8 +1765,8 @@ class Stereographic(Projection):
                           b * y_axis_offset + false_northing)
         coords = _ellipse_boundary(self._x_limits[1], self._y_limits[1],
                                    false_easting, false_northing, 91)
-        self._boundary = sgeom.LinearRing(coords.T)
-        self.threshold = np.diff(self._x_limits)[0] * 1e-3
+        self._boundary = sgeom.LinearRing(coords)
+        self.threshold = (self._x_limits[1] - self._x_limits[0]) * 1e-3
 
     @property
     def boundary(self):
@@ -1482,8 +1806,8 @@ class Orthographic(Projection):
 
     def __init__(self, central_longitude=0.0, central_latitude=0.0,
                  globe=None):
-        if PROJ4_VERSION != ():
-            if (5, 0, 0) <= PROJ4_VERSION < (5, 1, 0):
+        if not _PROJ_VERSION_UNKNOWN:
+            if _PROJ_5_0_SERIES:
                 warnings.warn(
                     'The Orthographic projection in the v5.0.x series of Proj '
                     'incorrectly transforms points. Use this projection with '
@@ -1495,22 +1819,22 @@ class Orthographic(Projection):
                 'may be unreliable and should be used with caution.',
                 stacklevel=2)
 
-        proj4_params = [('proj', 'ortho'), ('lon_0', central_longitude),
-                        ('lat_0', central_latitude)]
+        proj4_params = (('proj', 'ortho'), ('lon_0', central_longitude),
+                        ('lat_0', central_latitude))
         super().__init__(proj4_params, globe=globe)
 
         # TODO: Let the globe return the semimajor axis always.
-        a = float(self.globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
+        a = _semimajor_axis(self.globe)
 
         # To stabilise the projection of geometries, we reduce the boundary by
         # a tiny fraction at the cost of the extreme edges.
         coords = _ellipse_boundary(a * 0.99999, a * 0.99999, n=61)
-        self._boundary = sgeom.polygon.LinearRing(coords.T)
-        mins = np.min(coords, axis=1)
-        maxs = np.max(coords, axis=1)
+        self._boundary = sgeom.polygon.LinearRing(coords)
+        mins = coords.min(axis=0)
+        maxs = coords.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
-        self.threshold = np.diff(self._x_limits)[0] * 0.02
+        self.threshold = (self._x_limits[1] - self._x_limits[0]) * 0.02
 
     @property
     def boundary(self):
@@ -1525,46 +1849,71 @@ class Orthographic(Projection):
         return self._y_limits
 
 
+# Cache of warped-rectangular boundary points, keyed on the proj4
+# definition and the longitude bounds.  The proj4 string completely
+# determines the transform, so repeated constructions of equivalent
+# projections skip the 183-point Proj transform.
+_warped_boundary_cache = {}
+
+
 class _WarpedRectangularProjection(Projection, metaclass=ABCMeta):
     def __init__(self, proj4_params, central_longitude,
                  false_easting=None, false_northing=None, globe=None):
         if false_easting is not None:
-            proj4_params += [('x_0', false_easting)]
+            proj4_params += (('x_0', false_easting),)
         if false_northing is not None:
-            proj4_params += [('y_0', false_northing)]
+            proj4_params += (('y_0', false_northing),)
         super().__init__(proj4_params, globe=globe)
+        self._longitude_bounds = \
+            self._determine_longitude_bounds(central_longitude)
 
+    def _obtain_boundary(self):
         # Obtain boundary points
-        minlon, maxlon = self._determine_longitude_bounds(central_longitude)
-        n = 91
-        lon = np.empty(2 * n + 1)
-        lat = np.empty(2 * n + 1)
-        lon[:n] = minlon
-        lat[:n] = np.linspace(-90, 90, n)
-        lon[n:2 * n] = maxlon
-        lat[n:2 * n] = np.linspace(90, -90, n)
-        lon[-1] = minlon
-        lat[-1] = -90
-        points = self.transform_points(self.as_geodetic(), lon, lat)
-
+        minlon, maxlon = self._longitude_bounds
+        key = (self.proj4_init, minlon, maxlon)
+        try:
+            points, self._x_limits, self._y_limits = \
+                _warped_boundary_cache[key]
+        except KeyError:
+            n = 91
+            lat_half = _lin_ramp(-90, 90, n)
+            lon = np.concatenate([np.full(n, minlon), np.full(n, maxlon),
+                                  [minlon]])
+            lat = np.concatenate([lat_half, lat_half[::-1], [-90]])
+            points = self.transform_points(self._geodetic, lon, lat)
+
+            pts = np.ascontiguousarray(points[:, :2])
+            mins = pts.min(axis=0)
+            maxs = pts.max(axis=0)
+            self._x_limits = mins[0], maxs[0]
+            self._y_limits = mins[1], maxs[1]
+            _warped_boundary_cache[key] = (
+                points, self._x_limits, self._y_limits)
         self._boundary = sgeom.LinearRing(points)
 
-        mins = np.min(points, axis=0)
-        maxs = np.max(points, axis=0)
-        self._x_limits = mins[0], maxs[0]
-        self._y_limits = mins[1], maxs[1]
-
     @property
     def boundary(self):
-        return self._boundary
+        try:
+            return self._boundary
+        except AttributeError:
+            self._obtain_boundary()
+            return self._boundary
 
     @property
     def x_limits(self):
-        return self._x_limits
+        try:
+            return self._x_limits
+        except AttributeError:
+            self._obtain_boundary()
+            return self._x_limits
 
     @property
     def y_limits(self):
-        return self._y_limits
+        try:
+            return self._y_limits
+        except AttributeError:
+            self._obtain_boundary()
+            return self._y_limits
 
 
 class _Eckert(_WarpedRectangularProjection, metaclass=ABCMeta):
@@ -1596,8 +1945,8 @@ class _Eckert(_WarpedRectangularProjection, metaclass=ABCMeta):
                 This projection does not handle elliptical globes.
 
         """
-        proj4_params = [('proj', self._proj_name),
-                        ('lon_0', central_longitude)]
+        proj4_params = (('proj', self._proj_name),
+                        ('lon_0', central_longitude))
         super().__init__(proj4_params, central_longitude,
                          false_easting=false_easting,
                          false_northing=false_northing,
@@ -1717,12 +2066,12 @@ class EqualEarth(_WarpedRectangularProjection):
             If omitted, a default globe is created.
 
         """
-        if PROJ4_VERSION < (5, 2, 0):
+        if _PROJ_LT_5_2_0:
             raise ValueError('The EqualEarth projection requires Proj version '
                              '5.2.0, but you are using {}.'
                              .format('.'.join(str(v) for v in PROJ4_VERSION)))
 
-        proj_params = [('proj', 'eqearth'), ('lon_0', central_longitude)]
+        proj_params = (('proj', 'eqearth'), ('lon_0', central_longitude))
         super().__init__(proj_params, central_longitude,
                          false_easting=false_easting,
                          false_northing=false_northing,
@@ -1763,7 +2112,7 @@ class Mollweide(_WarpedRectangularProjection):
                 This projection does not handle elliptical globes.
 
         """
-        proj4_params = [('proj', 'moll'), ('lon_0', central_longitude)]
+        proj4_params = (('proj', 'moll'), ('lon_0', central_longitude))
         super().__init__(proj4_params, central_longitude,
                          false_easting=false_easting,
                          false_northing=false_northing,
@@ -1806,8 +2155,8 @@ class Robinson(_WarpedRectangularProjection):
         # Warn when using Robinson with proj 4.8 due to discontinuity at
         # 40 deg N introduced by incomplete fix to issue #113 (see
         # https://github.com/OSGeo/proj.4/issues/113).
-        if PROJ4_VERSION != ():
-            if (4, 8) <= PROJ4_VERSION < (4, 9):
+        if not _PROJ_VERSION_UNKNOWN:
+            if _PROJ_4_8_SERIES:
                 warnings.warn('The Robinson projection in the v4.8.x series '
                               'of Proj contains a discontinuity at '
                               '40 deg latitude. Use this projection with '
@@ -1819,7 +2168,7 @@ class Robinson(_WarpedRectangularProjection):
                           'with caution.',
                           stacklevel=2)
 
-        proj4_params = [('proj', 'robin'), ('lon_0', central_longitude)]
+        proj4_params = (('proj', 'robin'), ('lon_0', central_longitude))
         super().__init__(proj4_params, central_longitude,
                          false_easting=false_easting,
                          false_northing=false_northing,
@@ -1840,7 +2189,8 @@ class Robinson(_WarpedRectangularProjection):
             (nan, y-value), this patched version doesn't support that.
 
         """
-        if np.isnan(x) or np.isnan(y):
+        # math.isnan avoids the ufunc dispatch of np.isnan on scalars.
+        if math.isnan(x) or math.isnan(y):
             result = (np.nan, np.nan)
         else:
             result = super().transform_point(x, y, src_crs)
@@ -1861,16 +2211,19 @@ class Robinson(_WarpedRectangularProjection):
             Instead, we invalidate any of the points that contain a NaN.
 
         """
-        input_point_nans = np.isnan(x) | np.isnan(y)
-        if z is not None:
-            input_point_nans |= np.isnan(z)
-        handle_nans = np.any(input_point_nans)
+        # NaN propagates through addition, so summing the coordinates
+        # finds the poisoned points in one vector pass instead of one
+        # isnan sweep per component.
+        coord_sum = x + y if z is None else x + y + z
+        input_point_nans = np.isnan(coord_sum)
+        handle_nans = input_point_nans.any()
         if handle_nans:
-            # Remove NaN points from input data to avoid the error.
-            x[input_point_nans] = 0.0
-            y[input_point_nans] = 0.0
+            # Replace NaN points with a harmless value on copies of the
+            # inputs, rather than writing zeros into the caller's arrays.
+            x = np.where(input_point_nans, 0.0, x)
+            y = np.where(input_point_nans, 0.0, y)
             if z is not None:
-                z[input_point_nans] = 0.0
+                z = np.where(input_point_nans, 0.0, z)
         result = super().transform_points(src_crs, x, y, z)
         if handle_nans:
             # Result always has shape (N, 3).
@@ -1906,16 +2259,17 @@ class InterruptedGoodeHomolosine(Projection):
         """
 
         if emphasis == 'land':
-            proj4_params = [('proj', 'igh'), ('lon_0', central_longitude)]
+            proj4_params = (('proj', 'igh'), ('lon_0', central_longitude))
             super().__init__(proj4_params, globe=globe)
 
         elif emphasis == 'ocean':
-            if PROJ4_VERSION < (7, 1, 0):
+            if _PROJ_LT_7_1_0:
                 _proj_ver = '.'.join(str(v) for v in PROJ4_VERSION)
                 raise ValueError('The Interrupted Goode Homolosine ocean '
                                  'projection requires Proj version 7.1.0, '
                                  'but you are using ' + _proj_ver)
-            proj4_params = [('proj', 'igh_o'), ('lon_0', central_longitude)]
+            proj4_params = (('proj', 'igh_o'),
+                            ('lon_0', central_longitude))
             super().__init__(proj4_params, globe=globe)
 
         else:
@@ -1933,51 +2287,53 @@ class InterruptedGoodeHomolosine(Projection):
         elif emphasis == 'ocean':
             top_interrupted_lons = (-90.0, 60.0)
             bottom_interrupted_lons = (90.0, -60.0)
-        lons = np.empty(
-            (2 + 2 * len(top_interrupted_lons + bottom_interrupted_lons)) * n +
-            1)
-        lats = np.empty(
-            (2 + 2 * len(top_interrupted_lons + bottom_interrupted_lons)) * n +
-            1)
-        end = 0
+        # Latitude ramps shared between the interruptions, computed once
+        # instead of one linspace per segment.
+        lat_up = _lin_ramp(-90, 90, n)
+        lat_down = _lin_ramp(90, -90, n)
+        lat_to_equator = _lin_ramp(90, 0, n)
+        lat_to_pole = _lin_ramp(0, 90, n)
+        lat_from_south = _lin_ramp(-90, 0, n)
+        lat_to_south = _lin_ramp(0, -90, n)
+
+        lon_parts = []
+        lat_parts = []
 
         # Left boundary
-        lons[end:end + n] = minlon
-        lats[end:end + n] = np.linspace(-90, 90, n)
-        end += n
+        lon_parts.append(np.full(n, minlon))
+        lat_parts.append(lat_up)
 
         # Top boundary
         for lon in top_interrupted_lons:
-            lons[end:end + n] = lon - epsilon + central_longitude
-            lats[end:end + n] = np.linspace(90, 0, n)
-            end += n
-            lons[end:end + n] = lon + epsilon + central_longitude
-            lats[end:end + n] = np.linspace(0, 90, n)
-            end += n
+            lon_parts.append(np.full(n, lon - epsilon + central_longitude))
+            lat_parts.append(lat_to_equator)
+            lon_parts.append(np.full(n, lon + epsilon + central_longitude))
+            lat_parts.append(lat_to_pole)
 
         # Right boundary
-        lons[end:end + n] = maxlon
-        lats[end:end + n] = np.linspace(90, -90, n)
-        end += n
+        lon_parts.append(np.full(n, maxlon))
+        lat_parts.append(lat_down)
 
         # Bottom boundary
         for lon in bottom_interrupted_lons:
-            lons[end:end + n] = lon + epsilon + central_longitude
-            lats[end:end + n] = np.linspace(-90, 0, n)
-            end += n
-            lons[end:end + n] = lon - epsilon + central_longitude
-            lats[end:end + n] = np.linspace(0, -90, n)
-            end += n
+            lon_parts.append(np.full(n, lon + epsilon + central_longitude))
+            lat_parts.append(lat_from_south)
+            lon_parts.append(np.full(n, lon - epsilon + central_longitude))
+            lat_parts.append(lat_to_south)
 
         # Close loop
-        lons[-1] = minlon
-        lats[-1] = -90
+        lon_parts.append([minlon])
+        lat_parts.append([-90.0])
+
+        lons = np.concatenate(lon_parts)
+        lats = np.concatenate(lat_parts)
 
-        points = self.transform_points(self.as_geodetic(), lons, lats)
+        points = self.transform_points(self._geodetic, lons, lats)
         self._boundary = sgeom.LinearRing(points)
 
-        mins = np.min(points, axis=0)
-        maxs = np.max(points, axis=0)
+        pts = np.ascontiguousarray(points[:, :2])
+        mins = pts.min(axis=0)
+        maxs = pts.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
 
@@ -2010,12 +2366,13 @@ class _Satellite(Projection):
         super().__init__(proj4_params, globe=globe)
 
     def _set_boundary(self, coords):
-        self._boundary = sgeom.LinearRing(coords.T)
-        mins = np.min(coords, axis=1)
-        maxs = np.max(coords, axis=1)
+        # coords is an (n, 2) vertex array as built by _ellipse_boundary.
+        self._boundary = sgeom.LinearRing(coords)
+        mins = coords.min(axis=0)
+        maxs = coords.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
-        self.threshold = np.diff(self._x_limits)[0] * 0.02
+        self.threshold = (self._x_limits[1] - self._x_limits[0]) * 0.02
 
     @property
     def boundary(self):
@@ -2075,7 +2432,7 @@ class Geostationary(_Satellite):
             sweep_axis=sweep_axis)
 
         # TODO: Let the globe return the semimajor axis always.
-        a = float(self.globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
+        a = _semimajor_axis(self.globe)
         h = float(satellite_height)
 
         # These are only exact for a spherical Earth, owing to assuming a is
@@ -2086,11 +2443,11 @@ class Geostationary(_Satellite):
         # Using Napier's rules for right spherical triangles
         # See R2 and R6 (x and y coords are h * b and h * a, respectively):
         # https://en.wikipedia.org/wiki/Spherical_trigonometry
-        t = np.linspace(0, -2 * np.pi, 61)  # Clockwise boundary.
-        coords = np.vstack([np.arctan(tan_max_th * np.cos(t)),
-                            np.arcsin(sin_max_th * np.sin(t))])
+        cos_t, sin_t = _boundary_trig(61)  # Clockwise boundary.
+        coords = np.column_stack([np.arctan(tan_max_th * cos_t),
+                                  np.arcsin(sin_max_th * sin_t)])
         coords *= h
-        coords += np.array([[false_easting], [false_northing]])
+        coords += np.array([false_easting, false_northing])
         self._set_boundary(coords)
 
 
@@ -2140,7 +2497,7 @@ class NearsidePerspective(_Satellite):
             globe=globe)
 
         # TODO: Let the globe return the semimajor axis always.
-        a = self.globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS
+        a = _semimajor_axis(self.globe)
 
         h = float(satellite_height)
         max_x = a * np.sqrt(h / (2 * a + h))
@@ -2185,35 +2542,26 @@ class AlbersEqualArea(Projection):
                         ('x_0', false_easting),
                         ('y_0', false_northing)]
         if standard_parallels is not None:
-            try:
+            # A plain isinstance check keeps scalar parallels (the common
+            # case) off the exception machinery.
+            if isinstance(standard_parallels, (int, float, np.number)):
+                proj4_params.append(('lat_1', standard_parallels))
+            else:
                 proj4_params.append(('lat_1', standard_parallels[0]))
-                try:
+                if len(standard_parallels) > 1:
                     proj4_params.append(('lat_2', standard_parallels[1]))
-                except IndexError:
-                    pass
-            except TypeError:
-                proj4_params.append(('lat_1', standard_parallels))
 
         super().__init__(proj4_params, globe=globe)
 
         # bounds
         minlon, maxlon = self._determine_longitude_bounds(central_longitude)
-        n = 103
-        lons = np.empty(2 * n + 1)
-        lats = np.empty(2 * n + 1)
-        tmp = np.linspace(minlon, maxlon, n)
-        lons[:n] = tmp
-        lats[:n] = 90
-        lons[n:-1] = tmp[::-1]
-        lats[n:-1] = -90
-        lons[-1] = lons[0]
-        lats[-1] = lats[0]
-
-        points = self.transform_points(self.as_geodetic(), lons, lats)
+        lons, lats = _conic_boundary_lonlat(minlon, maxlon)
+        points = self.transform_points(self._geodetic, lons, lats)
 
         self._boundary = sgeom.LinearRing(points)
-        mins = np.min(points, axis=0)
-        maxs = np.max(points, axis=0)
+        pts = np.ascontiguousarray(points[:, :2])
+        mins = pts.min(axis=0)
+        maxs = pts.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
 
@@ -2264,8 +2612,8 @@ class AzimuthalEquidistant(Projection):
         # Warn when using Azimuthal Equidistant with proj < 4.9.2 due to
         # incorrect transformation past 90 deg distance (see
         # https://github.com/OSGeo/proj.4/issues/246).
-        if PROJ4_VERSION != ():
-            if PROJ4_VERSION < (4, 9, 2):
+        if not _PROJ_VERSION_UNKNOWN:
+            if _PROJ_LT_4_9_2:
                 warnings.warn('The Azimuthal Equidistant projection in Proj '
                               'older than 4.9.2 incorrectly transforms points '
                               'farther than 90 deg from the origin. Use this '
@@ -2277,20 +2625,20 @@ class AzimuthalEquidistant(Projection):
                           'should be used with caution.',
                           stacklevel=2)
 
-        proj4_params = [('proj', 'aeqd'), ('lon_0', central_longitude),
+        proj4_params = (('proj', 'aeqd'), ('lon_0', central_longitude),
                         ('lat_0', central_latitude),
-                        ('x_0', false_easting), ('y_0', false_northing)]
+                        ('x_0', false_easting), ('y_0', false_northing))
         super().__init__(proj4_params, globe=globe)
 
         # TODO: Let the globe return the semimajor axis always.
-        a = float(self.globe.semimajor_axis or WGS84_SEMIMAJOR_AXIS)
-        b = float(self.globe.semiminor_axis or a)
+        a = _semimajor_axis(self.globe)
+        b = _semiminor_axis(self.globe, default=a)
 
         coords = _ellipse_boundary(a * np.pi, b * np.pi,
                                    false_easting, false_northing, 61)
-        self._boundary = sgeom.LinearRing(coords.T)
-        mins = np.min(coords, axis=1)
-        maxs = np.max(coords, axis=1)
+        self._boundary = sgeom.LinearRing(coords)
+        mins = coords.min(axis=0)
+        maxs = coords.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
 
@@ -2333,10 +2681,10 @@ class Sinusoidal(Projection):
             created.
 
         """
-        proj4_params = [('proj', 'sinu'),
+        proj4_params = (('proj', 'sinu'),
                         ('lon_0', central_longitude),
                         ('x_0', false_easting),
-                        ('y_0', false_northing)]
+                        ('y_0', false_northing))
         super().__init__(proj4_params, globe=globe)
 
         # Obtain boundary points
@@ -2346,16 +2694,17 @@ class Sinusoidal(Projection):
         lon = np.empty(2 * n + 1)
         lat = np.empty(2 * n + 1)
         lon[:n] = minlon
-        lat[:n] = np.linspace(-90, 90, n)
+        lat[:n] = _lin_ramp(-90, 90, n)
         lon[n:2 * n] = maxlon
-        lat[n:2 * n] = np.linspace(90, -90, n)
+        lat[n:2 * n] = _lin_ramp(90, -90, n)
         lon[-1] = minlon
         lat[-1] = -90
-        points = self.transform_points(self.as_geodetic(), lon, lat)
+        points = self.transform_points(self._geodetic, lon, lat)
 
         self._boundary = sgeom.LinearRing(points)
-        mins = np.min(points, axis=0)
-        maxs = np.max(points, axis=0)
+        pts = np.ascontiguousarray(points[:, :2])
+        mins = pts.min(axis=0)
+        maxs = pts.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
         self.threshold = max(np.abs(self.x_limits + self.y_limits)) * 1e-5
@@ -2415,35 +2764,26 @@ class EquidistantConic(Projection):
                         ('x_0', false_easting),
                         ('y_0', false_northing)]
         if standard_parallels is not None:
-            try:
+            # A plain isinstance check keeps scalar parallels (the common
+            # case) off the exception machinery.
+            if isinstance(standard_parallels, (int, float, np.number)):
+                proj4_params.append(('lat_1', standard_parallels))
+            else:
                 proj4_params.append(('lat_1', standard_parallels[0]))
-                try:
+                if len(standard_parallels) > 1:
                     proj4_params.append(('lat_2', standard_parallels[1]))
-                except IndexError:
-                    pass
-            except TypeError:
-                proj4_params.append(('lat_1', standard_parallels))
 
         super().__init__(proj4_params, globe=globe)
 
         # bounds
-        n = 103
-        lons = np.empty(2 * n + 1)
-        lats = np.empty(2 * n + 1)
         minlon, maxlon = self._determine_longitude_bounds(central_longitude)
-        tmp = np.linspace(minlon, maxlon, n)
-        lons[:n] = tmp
-        lats[:n] = 90
-        lons[n:-1] = tmp[::-1]
-        lats[n:-1] = -90
-        lons[-1] = lons[0]
-        lats[-1] = lats[0]
-
-        points = self.transform_points(self.as_geodetic(), lons, lats)
+        lons, lats = _conic_boundary_lonlat(minlon, maxlon)
+        points = self.transform_points(self._geodetic, lons, lats)
 
         self._boundary = sgeom.LinearRing(points)
-        mins = np.min(points, axis=0)
-        maxs = np.max(points, axis=0)
+        pts = np.ascontiguousarray(points[:, :2])
+        mins = pts.min(axis=0)
+        maxs = pts.max(axis=0)
         self._x_limits = mins[0], maxs[0]
         self._y_limits = mins[1], maxs[1]
 
@@ -2463,6 +2803,10 @@ class EquidistantConic(Projection):
 
 
 class _BoundaryPoint:
+    # Thousands of these can be created per projected polygon, so skip
+    # the per-instance __dict__; the attribute set is fixed.
+    __slots__ = ('distance', 'kind', 'data')
+
     def __init__(self, distance, kind, data):
         """
         A representation for a geometric object which is
@@ -2490,14 +2834,6 @@ class _BoundaryPoint:
         )
 
 
-def _find_first_ge(a, x):
-    for v in a:
-        if v.distance >= x:
-            return v
-    # We've gone all the way around, so pick the first point again.
-    return a[0]
-
-
 def epsg(code):
     """
     Return the projection which corresponds to the given EPSG code.
@@ -0,0 +1,93 @@
+# Copyright Cartopy Contributors
+#
+# This file is part of Cartopy and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+
+import numpy as np
+import shapely.geometry as sgeom
+
+import cartopy.crs as ccrs
+
+
+class TestFastPath:
+    # The fast path of project_geometry transforms coordinates directly,
+    # without boundary cutting, and preserves the input geometry type
+    # rather than wrapping the result in a Multi* container.
+
+    def test_point(self):
+        proj = ccrs.PlateCarree()
+        result = proj.project_geometry(sgeom.Point(10, 20), fast=True)
+        assert isinstance(result, sgeom.Point)
+        np.testing.assert_allclose((result.x, result.y), (10, 20))
+
+    def test_multipoint(self):
+        proj = ccrs.PlateCarree()
+        multi_point = sgeom.MultiPoint([(10, 20), (30, 40)])
+        result = proj.project_geometry(multi_point, fast=True)
+        assert isinstance(result, sgeom.MultiPoint)
+        assert len(result.geoms) == 2
+        np.testing.assert_allclose(
+            [(point.x, point.y) for point in result.geoms],
+            [(10, 20), (30, 40)])
+
+    def test_line_string(self):
+        # Unlike the default path, which returns a MultiLineString, the
+        # fast path hands back a plain LineString.
+        proj = ccrs.PlateCarree()
+        line_string = sgeom.LineString([(-10, 30), (10, 60)])
+        result = proj.project_geometry(line_string, fast=True)
+        assert isinstance(result, sgeom.LineString)
+        np.testing.assert_allclose(np.asarray(result.coords),
+                                   np.asarray(line_string.coords))
+
+    def test_linear_ring(self):
+        proj = ccrs.PlateCarree()
+        linear_ring = sgeom.polygon.LinearRing(
+            [(-10, -10), (10, -10), (10, 10), (-10, 10)])
+        result = proj.project_geometry(linear_ring, fast=True)
+        assert isinstance(result, sgeom.polygon.LinearRing)
+        np.testing.assert_allclose(np.asarray(result.coords),
+                                   np.asarray(linear_ring.coords))
+
+    def test_multi_line_string(self):
+        proj = ccrs.PlateCarree()
+        multi_line_string = sgeom.MultiLineString([[(0, 0), (10, 10)],
+                                                   [(5, 5), (6, 7)]])
+        result = proj.project_geometry(multi_line_string, fast=True)
+        assert isinstance(result, sgeom.MultiLineString)
+        assert len(result.geoms) == 2
+
+    def test_polygon_with_interior(self):
+        # Unlike the default path, which returns a MultiPolygon, the
+        # fast path hands back a plain Polygon with its holes intact.
+        proj = ccrs.PlateCarree()
+        polygon = sgeom.Polygon(
+            [(-40, -40), (40, -40), (40, 40), (-40, 40)],
+            [[(-5, -5), (-5, 5), (5, 5), (5, -5)]])
+        result = proj.project_geometry(polygon, fast=True)
+        assert isinstance(result, sgeom.Polygon)
+        assert len(result.interiors) == 1
+        np.testing.assert_allclose(result.area, polygon.area)
+
+    def test_multipolygon(self):
+        proj = ccrs.PlateCarree()
+        polygon = sgeom.Polygon(
+            [(-40, -40), (40, -40), (40, 40), (-40, 40)],
+            [[(-5, -5), (-5, 5), (5, 5), (5, -5)]])
+        result = proj.project_geometry(sgeom.MultiPolygon([polygon]),
+                                       fast=True)
+        assert isinstance(result, sgeom.MultiPolygon)
+        assert len(result.geoms) == 1
+        np.testing.assert_allclose(result.area, polygon.area)
+
+    def test_no_cutting(self):
+        # The fast path must not cut at the projection boundary; a
+        # boundary-crossing line stays one piece.
+        proj = ccrs.PlateCarree()
+        line_string = sgeom.LineString([(150, 0), (-150, 0)])
+        result = proj.project_geometry(line_string,
+                                       ccrs.PlateCarree(central_longitude=180),
+                                       fast=True)
+        assert isinstance(result, sgeom.LineString)
+        assert len(result.coords) == 2
@@ -0,0 +1,95 @@
+# Copyright Cartopy Contributors
+#
+# This file is part of Cartopy and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+
+import shapely.geometry as sgeom
+
+import cartopy.crs as ccrs
+
+
+class TestSameCrsShortCircuit:
+    # When src_crs equals the target projection, project_geometry
+    # bypasses the cutting pipeline for geometries lying entirely
+    # within the domain.  The bypass must keep the return types of the
+    # full pipeline, and boundary-crossing geometries must still go
+    # through it.
+
+    def test_point(self):
+        proj = ccrs.PlateCarree()
+        point = sgeom.Point(10, 20)
+        result = proj.project_geometry(point, proj)
+        assert isinstance(result, sgeom.Point)
+        assert result.equals(point)
+
+    def test_multipoint(self):
+        proj = ccrs.PlateCarree()
+        multi_point = sgeom.MultiPoint([(10, 20), (30, 40)])
+        result = proj.project_geometry(multi_point, proj)
+        assert isinstance(result, sgeom.MultiPoint)
+        assert result.equals(multi_point)
+
+    def test_line_string(self):
+        proj = ccrs.PlateCarree()
+        line_string = sgeom.LineString([(-10, 30), (10, 60)])
+        result = proj.project_geometry(line_string, proj)
+        assert isinstance(result, sgeom.MultiLineString)
+        assert len(result) == 1
+        assert result[0].equals(line_string)
+
+    def test_linear_ring(self):
+        proj = ccrs.PlateCarree()
+        linear_ring = sgeom.polygon.LinearRing(
+            [(-10, -10), (10, -10), (10, 10), (-10, 10)])
+        rings, multi_line_string = proj.project_geometry(linear_ring, proj)
+        assert len(rings) == 1
+        assert isinstance(rings[0], sgeom.polygon.LinearRing)
+        assert rings[0].equals(linear_ring)
+        assert isinstance(multi_line_string, sgeom.MultiLineString)
+        assert len(multi_line_string) == 0
+
+    def test_polygon(self):
+        proj = ccrs.PlateCarree()
+        polygon = sgeom.Polygon(
+            [(-40, -40), (40, -40), (40, 40), (-40, 40)],
+            [[(-5, -5), (-5, 5), (5, 5), (5, -5)]])
+        result = proj.project_geometry(polygon, proj)
+        assert isinstance(result, sgeom.MultiPolygon)
+        assert len(result) == 1
+        assert result[0].equals(polygon)
+
+    def test_multipolygon(self):
+        proj = ccrs.PlateCarree()
+        polygon = sgeom.Polygon(
+            [(-40, -40), (40, -40), (40, 40), (-40, 40)])
+        multi_polygon = sgeom.MultiPolygon([polygon])
+        result = proj.project_geometry(multi_polygon, proj)
+        assert isinstance(result, sgeom.MultiPolygon)
+        assert result.equals(multi_polygon)
+
+    def test_equal_crs_instance(self):
+        # The bypass applies to an equivalent CRS, not just the same
+        # instance.
+        proj = ccrs.PlateCarree()
+        line_string = sgeom.LineString([(-10, 30), (10, 60)])
+        result = proj.project_geometry(line_string, ccrs.PlateCarree())
+        assert isinstance(result, sgeom.MultiLineString)
+        assert len(result) == 1
+        assert result[0].equals(line_string)
+
+    def test_line_string_falls_through(self):
+        # A geometry leaving the domain must still be cut by the full
+        # pipeline.
+        proj = ccrs.PlateCarree()
+        line_string = sgeom.LineString([(170, 0), (190, 0)])
+        result = proj.project_geometry(line_string, proj)
+        assert isinstance(result, sgeom.MultiLineString)
+        assert len(result) == 2
+
+    def test_polygon_falls_through(self):
+        proj = ccrs.PlateCarree()
+        polygon = sgeom.box(170, 0, 190, 10)
+        result = proj.project_geometry(polygon, proj)
+        assert isinstance(result, sgeom.MultiPolygon)
+        assert len(result) == 2